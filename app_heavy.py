@@ -1,5 +1,19 @@
+import csv
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+
 import streamlit as st
-from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
+from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM, LogitsProcessor, LogitsProcessorList
+from transformers.modeling_outputs import BaseModelOutput
 import torch
 
 # Page configuration
@@ -177,11 +191,76 @@ Food is a human right, not a privilege.""",
     "Custom Template": ""
 }
 
+# Organizing terminology kept consistent across translations, keyed by target
+# language. Source terms are English and matched case-insensitively.
+GLOSSARY = {
+    "spa_Latn": {
+        "mutual aid": "ayuda mutua",
+        "tenant union": "sindicato de inquilinos",
+        "worker center": "centro de trabajadores",
+        "food co-op": "cooperativa de alimentos",
+    },
+    "fra_Latn": {
+        "mutual aid": "entraide",
+        "tenant union": "syndicat de locataires",
+        "worker center": "centre de travailleurs",
+        "food co-op": "coopérative alimentaire",
+    },
+    "por_Latn": {
+        "mutual aid": "ajuda mútua",
+        "tenant union": "sindicato de inquilinos",
+        "worker center": "centro de trabalhadores",
+        "food co-op": "cooperativa de alimentos",
+    },
+    "deu_Latn": {
+        "mutual aid": "gegenseitige Hilfe",
+        "tenant union": "Mietergewerkschaft",
+        "worker center": "Arbeiterzentrum",
+        "food co-op": "Lebensmittelkooperative",
+    },
+}
+GLOSSARY_SOURCE_LANG = "eng_Latn"
+
+# Score bonuses for pending glossary terms. Starting a term is only nudged when
+# the model already ranks its first token among the top-k candidates; once a
+# term has started, its next piece always gets the continuation bonus. Both
+# are soft, so a clearly better token still wins.
+GLOSSARY_ENTRY_BIAS = 2.0
+GLOSSARY_CONTINUATION_BIAS = 2.0
+GLOSSARY_TOP_K = 5
+
+MODEL_NAME = "facebook/nllb-200-distilled-600M"
+
+# Encoder outputs are reused across target languages. A full 512-token input
+# holds ~1 MB of fp16 hidden states, so the byte budget binds for long texts
+# and the entry cap only limits bookkeeping for many short ones
+ENCODER_CACHE_MAX_BYTES = 32 * 1024 * 1024
+ENCODER_CACHE_MAX_ENTRIES = 256
+
+# Request deduplication and admission control for the shared model
+# Queued work is measured in source characters; a lone request is always admitted
+MAX_QUEUED_CHARACTERS = 20000
+RECENT_RESULT_TTL_SECONDS = 30
+RATE_LIMIT_CAPACITY = 40
+RATE_LIMIT_REFILL_PER_SECOND = 0.5
+
+# Broadcast exports are written to disk as each language completes
+EXPORT_BUFFER_BYTES = 64 * 1024
+EXPORT_ROOT = os.path.join(tempfile.gettempdir(), "community_translator_exports")
+EXPORT_MAX_AGE_SECONDS = 6 * 60 * 60
+EXPORT_FORMATS = {
+    "txt": ("📄 Text", "community_broadcast_translations.txt", "text/plain"),
+    "jsonl": ("🧾 JSONL", "community_broadcast_translations.jsonl", "application/x-ndjson"),
+    "csv": ("📊 CSV", "community_broadcast_translations.csv", "text/csv"),
+    "html": ("🖨️ Flyer (HTML)", "community_broadcast_flyer.html", "text/html"),
+    "md": ("📝 Flyer (Markdown)", "community_broadcast_flyer.md", "text/markdown"),
+}
+
 # Initialize the model
 @st.cache_resource
 def load_translation_model():
     """Load the NLLB translation model with memory optimization"""
-    model_name = "facebook/nllb-200-distilled-600M"
+    model_name = MODEL_NAME
     try:
         tokenizer = AutoTokenizer.from_pretrained(model_name)
         # Load model with lower memory footprint
@@ -196,23 +275,581 @@ def load_translation_model():
         st.info("The model is large (~2.4GB). If running on Streamlit Cloud free tier, memory limits may be exceeded.")
         return None, None
 
-def translate_text(text, source_lang, target_lang, tokenizer, model):
-    """Translate text from source to target language"""
+class EncoderStateCache:
+    """LRU cache of encoder hidden states, evicted by total tensor memory"""
+
+    def __init__(self, max_bytes=ENCODER_CACHE_MAX_BYTES, max_entries=ENCODER_CACHE_MAX_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text_hash, source_lang, model_name=MODEL_NAME):
+        return (text_hash, source_lang, model_name)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, hidden_states, attention_mask):
+        size = (
+            hidden_states.element_size() * hidden_states.nelement()
+            + attention_mask.element_size() * attention_mask.nelement()
+        )
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[2]
+            self._entries[key] = (hidden_states, attention_mask, size)
+            self.total_bytes += size
+            while self._entries and (
+                self.total_bytes > self.max_bytes or len(self._entries) > self.max_entries
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= evicted[2]
+
+
+@st.cache_resource
+def get_encoder_cache():
+    """Shared encoder-state cache for all sessions"""
+    return EncoderStateCache()
+
+def hash_text(text):
+    """Stable key for a source text, shared by the encoder and request caches"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def encode_source(text, source_lang, tokenizer, model, text_hash=None):
+    """Run the encoder once per (text, source language) and reuse the result"""
+    cache = get_encoder_cache()
+    key = EncoderStateCache.make_key(text_hash or hash_text(text), source_lang)
+    entry = cache.get(key)
+    if entry is not None:
+        return entry[0], entry[1]
+
     tokenizer.src_lang = source_lang
     inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512)
+    with torch.no_grad():
+        encoder_outputs = model.get_encoder()(
+            input_ids=inputs["input_ids"],
+            attention_mask=inputs["attention_mask"],
+            return_dict=True
+        )
+
+    hidden_states = encoder_outputs.last_hidden_state
+    attention_mask = inputs["attention_mask"]
+    cache.put(key, hidden_states, attention_mask)
+    return hidden_states, attention_mask
+
+_WORD_RE = re.compile(r"\w+(?:-\w+)*")
+
+class GlossaryIndex:
+    """Glossary for one target language, compiled once into two tries.
+
+    Source terms live in a word trie, so finding the terms in a text costs
+    O(words x longest term). Target terms live in a token-ID trie that the
+    logits processor walks while decoding. Lookups never scan the glossary.
+    """
+
+    def __init__(self, entries, tokenizer):
+        self.terms = list(entries.items())
+        self.source_trie = {}
+        self.target_trie = {}
+        self.first_tokens = {}
+
+        for term_id, (source_term, target_term) in enumerate(self.terms):
+            node = self.source_trie
+            for word in _WORD_RE.findall(source_term.lower()):
+                node = node.setdefault(word, {})
+            node[None] = term_id
+
+            # Sources are matched case-insensitively, so accept the usual
+            # casings on the target side too (e.g. all-caps headings)
+            variants = {target_term, target_term[:1].upper() + target_term[1:], target_term.title(), target_term.upper()}
+            first_tokens = set()
+            for variant in variants:
+                token_ids = tokenizer(variant, add_special_tokens=False)["input_ids"]
+                # Only whole-word matches: the first piece must start a word
+                if not token_ids or not tokenizer.convert_ids_to_tokens(token_ids[0]).startswith("▁"):
+                    continue
+                first_tokens.add(token_ids[0])
+                node = self.target_trie
+                for token_id in token_ids:
+                    child = node.setdefault(token_id, {"terms": set()})
+                    child["terms"].add(term_id)
+                    node = child
+                node["end"] = term_id
+            self.first_tokens[term_id] = sorted(first_tokens)
+
+    def find_terms(self, text):
+        """Count how often each glossary term occurs in the source text"""
+        words = _WORD_RE.findall(text.lower())
+        found = Counter()
+        for start in range(len(words)):
+            node = self.source_trie
+            for i in range(start, len(words)):
+                node = node.get(words[i])
+                if node is None:
+                    break
+                if None in node:
+                    found[node[None]] += 1
+        return found
+
+
+class GlossaryStats:
+    """Time spent in the glossary processor as a share of its decodes"""
+
+    def __init__(self):
+        self.steps = 0
+        self.decode_seconds = 0.0
+        self.processor_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, steps, decode_seconds, processor_seconds):
+        with self._lock:
+            self.steps += steps
+            self.decode_seconds += decode_seconds
+            self.processor_seconds += processor_seconds
+
+    def summary(self):
+        """(processor ms per decode step, share of decode time) or None"""
+        with self._lock:
+            if not self.steps or not self.decode_seconds:
+                return None
+            return (
+                1000 * self.processor_seconds / self.steps,
+                self.processor_seconds / self.decode_seconds
+            )
+
+
+class GlossaryLogitsProcessor(LogitsProcessor):
+    """Steers decoding toward the glossary terms found in the source text.
+
+    The constraint is soft: scores are only ever raised, never masked. The
+    first piece of a pending term gets a bonus when the model already ranks
+    it among its top-k candidates, and once a hypothesis has started a term
+    its next piece always gets a bonus. A term stays pending until it has
+    been produced as often as it occurs in the source.
+
+    Trie state is carried from the previous step: each row is matched to its
+    parent row and advanced by its newest token.
+    """
+
+    def __init__(
+        self,
+        index,
+        required_terms,
+        entry_bias=GLOSSARY_ENTRY_BIAS,
+        continuation_bias=GLOSSARY_CONTINUATION_BIAS,
+        top_k=GLOSSARY_TOP_K
+    ):
+        self.index = index
+        self.required = dict(required_terms)
+        self.entry_bias = entry_bias
+        self.continuation_bias = continuation_bias
+        self.top_k = top_k
+        self.steps = 0
+        self.seconds = 0.0
+        self._prev_ids = None
+        self._prev_states = []
+
+    def _advance(self, state, token_id):
+        active, emitted = state
+        next_active = []
+        for node in active + (self.index.target_trie,):
+            child = node.get(token_id)
+            if child is None or not any(term_id in self.required for term_id in child["terms"]):
+                continue
+            if "end" in child:
+                emitted = emitted + (child["end"],)
+            if len(child) > 2 or "end" not in child:
+                next_active.append(child)
+        return (tuple(next_active), emitted)
+
+    def _replay(self, token_ids):
+        state = ((), ())
+        for token_id in token_ids:
+            state = self._advance(state, token_id)
+        return state
+
+    def _row_states(self, input_ids):
+        prev = self._prev_ids
+        if prev is not None and prev.shape[1] == input_ids.shape[1] - 1:
+            # Beam search may reorder hypotheses, so find each row's parent
+            matches = (input_ids[:, None, :-1] == prev[None, :, :]).all(dim=-1)
+            parents = matches.int().argmax(dim=-1).tolist()
+            found = matches.any(dim=-1).tolist()
+            last_tokens = input_ids[:, -1].tolist()
+            states = [
+                self._advance(self._prev_states[parent], token_id) if ok else self._replay(input_ids[row].tolist())
+                for row, (parent, ok, token_id) in enumerate(zip(parents, found, last_tokens))
+            ]
+        else:
+            states = [self._replay(row) for row in input_ids.tolist()]
+        self._prev_ids = input_ids
+        self._prev_states = states
+        return states
+
+    def _pending(self, emitted):
+        counts = Counter(emitted)
+        return {term_id for term_id, needed in self.required.items() if counts[term_id] < needed}
+
+    def __call__(self, input_ids, scores):
+        started = time.perf_counter()
+        top_k = None
+        for row, (active, emitted) in enumerate(self._row_states(input_ids)):
+            pending = self._pending(emitted)
+            if not pending:
+                continue
+
+            continuations = sorted({
+                token_id
+                for node in active
+                for token_id, child in node.items()
+                if isinstance(token_id, int) and not child["terms"].isdisjoint(pending)
+            })
+            if continuations:
+                scores[row, continuations] += self.continuation_bias
+
+            if top_k is None:
+                top_k = scores.topk(self.top_k, dim=-1).indices.tolist()
+            entries = {token_id for term_id in pending for token_id in self.index.first_tokens[term_id]}
+            boosted = sorted(entries.intersection(top_k[row]).difference(continuations))
+            if boosted:
+                scores[row, boosted] += self.entry_bias
+
+        self.steps += 1
+        self.seconds += time.perf_counter() - started
+        return scores
+
+
+@st.cache_resource
+def get_glossary_index(target_lang, _tokenizer):
+    """Compile the glossary for one target language once per process"""
+    entries = GLOSSARY.get(target_lang)
+    return GlossaryIndex(entries, _tokenizer) if entries else None
+
+@st.cache_resource
+def get_glossary_stats():
+    """Shared decode-step timings for the glossary benchmark"""
+    return GlossaryStats()
+
+def translate_text(text, source_lang, target_lang, tokenizer, model, use_glossary=True, text_hash=None):
+    """Translate text from source to target language"""
+    hidden_states, attention_mask = encode_source(text, source_lang, tokenizer, model, text_hash)
 
     # Get the target language token ID
     target_lang_token = tokenizer.convert_tokens_to_ids(target_lang)
 
+    glossary_processor = None
+    if use_glossary and source_lang == GLOSSARY_SOURCE_LANG:
+        index = get_glossary_index(target_lang, tokenizer)
+        required_terms = index.find_terms(text) if index else Counter()
+        if required_terms:
+            glossary_processor = GlossaryLogitsProcessor(index, required_terms)
+
+    # generate() expands encoder outputs in place for beam search, so hand it
+    # a fresh wrapper and keep the cached tensors untouched
+    started = time.perf_counter()
     translated_tokens = model.generate(
-        **inputs,
+        encoder_outputs=BaseModelOutput(last_hidden_state=hidden_states),
+        attention_mask=attention_mask,
         forced_bos_token_id=target_lang_token,
-        max_length=512
+        max_length=512,
+        logits_processor=LogitsProcessorList([glossary_processor] if glossary_processor else [])
     )
 
+    # Compare processor time with the whole decode of the same call
+    if glossary_processor:
+        get_glossary_stats().record(
+            glossary_processor.steps, time.perf_counter() - started, glossary_processor.seconds
+        )
+
     translation = tokenizer.batch_decode(translated_tokens, skip_special_tokens=True)[0]
     return translation
 
+class TranslationBusyError(Exception):
+    """Raised when too much translation work is already queued"""
+
+
+class RateLimitExceededError(Exception):
+    """Raised when a session has used up its translation budget"""
+
+
+class TokenBucket:
+    """Per-session token bucket; each new translation costs one token"""
+
+    def __init__(self, capacity=RATE_LIMIT_CAPACITY, refill_per_second=RATE_LIMIT_REFILL_PER_SECOND):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+        self.updated = now
+
+    def try_acquire(self, cost=1):
+        with self._lock:
+            self._refill()
+            if self.tokens < cost:
+                return False
+            self.tokens -= cost
+            return True
+
+    def seconds_until_available(self, cost=1):
+        with self._lock:
+            self._refill()
+            missing = cost - self.tokens
+        return max(0.0, missing / self.refill_per_second)
+
+
+class TranslationScheduler:
+    """Registry of in-flight translations shared by every session.
+
+    Identical requests share one future: the first caller runs the work in its
+    own script thread while later callers wait on the result. Finished results
+    are kept briefly so a double-click rerun does not translate again. Model
+    work is serialized, and new work is refused once the queued source text
+    would exceed the character budget.
+    """
+
+    def __init__(self, max_queued_work=MAX_QUEUED_CHARACTERS, result_ttl=RECENT_RESULT_TTL_SECONDS):
+        self.max_queued_work = max_queued_work
+        self.result_ttl = result_ttl
+        self.queued_work = 0
+        self._inflight = {}
+        self._recent = OrderedDict()
+        self._lock = threading.Lock()
+        self._model_lock = threading.Lock()
+
+    def _prune_recent(self, now):
+        while self._recent:
+            key, (finished_at, _) = next(iter(self._recent.items()))
+            if now - finished_at <= self.result_ttl:
+                break
+            self._recent.popitem(last=False)
+
+    def _finish(self, key):
+        _, work = self._inflight.pop(key)
+        self.queued_work -= work
+
+    def run(self, key, fn, *args, bucket=None, work=1):
+        with self._lock:
+            now = time.monotonic()
+            self._prune_recent(now)
+            if key in self._recent:
+                return self._recent[key][1].result()
+
+            inflight = self._inflight.get(key)
+            owner = inflight is None
+            if owner:
+                if self._inflight and self.queued_work + work > self.max_queued_work:
+                    raise TranslationBusyError(
+                        "The translator is busy right now. Please wait a moment and try again."
+                    )
+                if bucket is not None and not bucket.try_acquire():
+                    wait = bucket.seconds_until_available()
+                    raise RateLimitExceededError(
+                        f"Too many translations in a short time. Please wait about {wait:.0f} seconds."
+                    )
+                future = Future()
+                self._inflight[key] = (future, work)
+                self.queued_work += work
+            else:
+                future = inflight[0]
+
+        if not owner:
+            return future.result()
+
+        try:
+            with self._model_lock:
+                result = fn(*args)
+        except BaseException as e:
+            # Waiters must never hang, even if this script run is interrupted
+            if isinstance(e, Exception):
+                future.set_exception(e)
+            else:
+                future.set_exception(TranslationBusyError("The translation was interrupted. Please try again."))
+            with self._lock:
+                self._finish(key)
+            raise
+
+        future.set_result(result)
+        with self._lock:
+            self._finish(key)
+            self._recent[key] = (time.monotonic(), future)
+        return result
+
+
+@st.cache_resource
+def get_translation_scheduler():
+    """Shared request registry for all sessions"""
+    return TranslationScheduler()
+
+def get_session_bucket():
+    """Rate-limit bucket for the current browser session"""
+    if "rate_limit_bucket" not in st.session_state:
+        st.session_state["rate_limit_bucket"] = TokenBucket()
+    return st.session_state["rate_limit_bucket"]
+
+def request_translation(text, source_lang, target_lang, tokenizer, model, use_glossary=True):
+    """Translate through the shared scheduler, deduplicating identical requests"""
+    text_hash = hash_text(text)
+    key = (text_hash, source_lang, target_lang, MODEL_NAME, use_glossary)
+    return get_translation_scheduler().run(
+        key, translate_text, text, source_lang, target_lang, tokenizer, model, use_glossary, text_hash,
+        bucket=get_session_bucket(),
+        work=len(text)
+    )
+
+class BroadcastExporter:
+    """Writes broadcast results to every export format as languages complete.
+
+    Each file is flushed after every language, so a partial export is usable
+    if the broadcast stops early, and nothing is collected in memory.
+    """
+
+    def __init__(self, source_text, source_lang_name, export_dir=None):
+        if export_dir is None:
+            os.makedirs(EXPORT_ROOT, exist_ok=True)
+            export_dir = tempfile.mkdtemp(prefix="broadcast_export_", dir=EXPORT_ROOT)
+        self.export_dir = export_dir
+        self.completed = 0
+        self._files = {
+            fmt: open(self.path(fmt), "w", encoding="utf-8", newline="", buffering=EXPORT_BUFFER_BYTES)
+            for fmt in EXPORT_FORMATS
+        }
+        self._csv = csv.writer(self._files["csv"])
+        self._write_headers(source_text, source_lang_name)
+
+    def path(self, fmt):
+        return os.path.join(self.export_dir, EXPORT_FORMATS[fmt][1])
+
+    def _write_headers(self, source_text, source_lang_name):
+        txt = self._files["txt"]
+        txt.write(f"MULTI-LANGUAGE BROADCAST\n{'='*50}\n\n")
+        txt.write(f"ORIGINAL ({source_lang_name}):\n{source_text}\n\n")
+        txt.write(f"{'='*50}\n\nTRANSLATIONS:\n\n")
+
+        self._files["jsonl"].write(json.dumps(
+            {"language": source_lang_name, "original": True, "text": source_text},
+            ensure_ascii=False
+        ) + "\n")
+
+        self._csv.writerow(["language", "language_code", "text", "error"])
+
+        self._files["html"].write(f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Multi-Language Broadcast</title>
+<style>
+body {{ font-family: sans-serif; max-width: 48rem; margin: 2rem auto; color: #222; }}
+h1 {{ color: #5f27cd; text-align: center; }}
+section {{ border-left: 4px solid #6c5ce7; padding: 0.5rem 1rem; margin: 1.5rem 0; page-break-inside: avoid; }}
+h2 {{ color: #5f27cd; font-size: 1.1rem; margin: 0 0 0.5rem; }}
+p {{ white-space: pre-wrap; line-height: 1.6; margin: 0; }}
+@media print {{ body {{ margin: 0; }} }}
+</style>
+</head>
+<body>
+<h1>✊ Multi-Language Broadcast</h1>
+<section><h2>{html.escape(source_lang_name)}</h2><p dir="auto">{html.escape(source_text)}</p></section>
+""")
+
+        self._files["md"].write(
+            f"# ✊ Multi-Language Broadcast\n\n## {source_lang_name}\n\n{source_text}\n\n"
+        )
+
+        self.flush()
+
+    def add(self, lang_name, lang_code, text, error=None):
+        """Append one finished language to every export"""
+        self._files["txt"].write(f"{lang_name.upper()}:\n{text}\n\n{'-'*50}\n\n")
+        self._files["jsonl"].write(json.dumps(
+            {"language": lang_name, "language_code": lang_code, "text": text, "error": error},
+            ensure_ascii=False
+        ) + "\n")
+        self._csv.writerow([lang_name, lang_code, text, error or ""])
+        # Failed languages stay in the data exports but not in the flyers
+        if error is None:
+            self._files["html"].write(
+                f'<section><h2>{html.escape(lang_name)}</h2><p dir="auto">{html.escape(text)}</p></section>\n'
+            )
+            self._files["md"].write(f"## {lang_name}\n\n{text}\n\n")
+        self.completed += 1
+        self.flush()
+
+    def flush(self):
+        for f in self._files.values():
+            f.flush()
+
+    def close(self):
+        if not self._files:
+            return
+        self._files["html"].write("</body>\n</html>\n")
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+
+def cleanup_stale_exports(max_age=EXPORT_MAX_AGE_SECONDS):
+    """Remove export directories left behind by sessions that have ended"""
+    if not os.path.isdir(EXPORT_ROOT):
+        return
+    cutoff = time.time() - max_age
+    for entry in os.scandir(EXPORT_ROOT):
+        try:
+            if entry.is_dir() and entry.name.startswith("broadcast_export_") and entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry.path, ignore_errors=True)
+        except OSError:
+            continue
+
+def render_export_downloads(export_dir, key_prefix):
+    """Download button for the chosen export format.
+
+    st.download_button keeps its data in memory, so only the selected file
+    is read from disk on each rerun. Returns False if the export has been
+    removed, e.g. by another session's stale-export cleanup.
+    """
+    available = [
+        fmt for fmt, (_, file_name, _) in EXPORT_FORMATS.items()
+        if os.path.exists(os.path.join(export_dir, file_name))
+    ]
+    if not available:
+        return False
+
+    col_format, col_download = st.columns([2, 1])
+    with col_format:
+        fmt = st.selectbox(
+            "Export format",
+            options=available,
+            format_func=lambda f: EXPORT_FORMATS[f][0],
+            key=f"{key_prefix}_format"
+        )
+    label, file_name, mime = EXPORT_FORMATS[fmt]
+    try:
+        f = open(os.path.join(export_dir, file_name), "rb")
+    except FileNotFoundError:
+        return False
+    with col_download, f:
+        st.download_button(
+            label=f"📥 Download {label}",
+            data=f,
+            file_name=file_name,
+            mime=mime,
+            key=f"{key_prefix}_{fmt}"
+        )
+    return True
+
 # Header
 st.markdown("""
     <div class="solidarity-banner">
@@ -259,6 +896,29 @@ with st.sidebar:
 
     st.divider()
 
+    st.markdown("### 📖 Organizing Glossary")
+    use_glossary = st.checkbox(
+        "Keep organizing terms consistent",
+        value=True,
+        key="use_glossary",
+        help="Translate terms like \"mutual aid\" the same way every time (English source only)"
+    )
+    with st.expander("View glossary"):
+        for lang_name, lang_code in LANGUAGES.items():
+            if lang_code in GLOSSARY:
+                st.markdown(f"**{lang_name}**")
+                for source_term, target_term in GLOSSARY[lang_code].items():
+                    st.markdown(f"- {source_term} → {target_term}")
+        glossary_overhead = get_glossary_stats().summary()
+        if glossary_overhead:
+            processor_ms, share = glossary_overhead
+            st.caption(
+                f"Glossary processor: {processor_ms:.2f} ms per decode step "
+                f"({share:.1%} of decode time for glossary translations)"
+            )
+
+    st.divider()
+
     st.info("""
         **Powered by:**
         Meta's NLLB-200 Model
@@ -316,7 +976,7 @@ with tab1:
                         source_code = LANGUAGES[source_lang_name]
                         target_code = LANGUAGES[target_lang_name]
 
-                        translation = translate_text(input_text, source_code, target_code, tokenizer, model)
+                        translation = request_translation(input_text, source_code, target_code, tokenizer, model, use_glossary)
 
                         st.markdown("### ✅ Translation Result")
                         st.markdown(f"""
@@ -331,6 +991,8 @@ with tab1:
                         # Copy button
                         st.code(translation, language=None)
 
+                    except (TranslationBusyError, RateLimitExceededError) as e:
+                        st.warning(f"⚠️ {str(e)}")
                     except Exception as e:
                         st.error(f"Translation error: {str(e)}")
                         st.info("Please check your internet connection for model download on first run.")
@@ -388,50 +1050,69 @@ with tab2:
             progress_bar = st.progress(0)
             status_text = st.empty()
 
-            translations = {}
+            # Replace the previous broadcast's export files
+            previous_export = st.session_state.pop("broadcast_export", None)
+            if previous_export:
+                shutil.rmtree(previous_export["dir"], ignore_errors=True)
+            cleanup_stale_exports()
 
-            for idx, target_lang_name in enumerate(selected_languages):
-                status_text.text(f"Translating to {target_lang_name}...")
-                progress_bar.progress((idx + 1) / len(selected_languages))
+            exporter = BroadcastExporter(broadcast_text, "English")
+            st.session_state["broadcast_export"] = {
+                "dir": exporter.export_dir,
+                "completed": 0,
+                "total": len(selected_languages)
+            }
 
-                try:
-                    target_code = LANGUAGES[target_lang_name]
-                    translation = translate_text(broadcast_text, source_code, target_code, tokenizer, model)
-                    translations[target_lang_name] = translation
-                except Exception as e:
-                    translations[target_lang_name] = f"[Translation Error: {str(e)}]"
+            # Display each translation as it finishes
+            st.markdown("### 📋 All Translations")
 
-            status_text.text("✅ All translations completed!")
-            st.balloons()
+            try:
+                for idx, target_lang_name in enumerate(selected_languages):
+                    status_text.text(f"Translating to {target_lang_name}...")
+                    progress_bar.progress((idx + 1) / len(selected_languages))
 
-            # Display all translations
-            st.markdown("### 📋 All Translations")
+                    target_code = LANGUAGES[target_lang_name]
+                    try:
+                        translation = request_translation(broadcast_text, source_code, target_code, tokenizer, model, use_glossary)
+                        exporter.add(target_lang_name, target_code, translation)
+                    except (TranslationBusyError, RateLimitExceededError) as e:
+                        st.warning(f"⚠️ {str(e)} Stopped after {exporter.completed} languages.")
+                        break
+                    except Exception as e:
+                        translation = f"[Translation Error: {str(e)}]"
+                        exporter.add(target_lang_name, target_code, translation, error=str(e))
 
-            for lang_name, translation in translations.items():
-                st.markdown(f"""
-                    <div class="translation-box">
-                        <div class="language-header">{lang_name}</div>
-                        <div style="font-size: 1.05rem; line-height: 1.6;">
-                            {translation}
+                    st.session_state["broadcast_export"]["completed"] = exporter.completed
+                    st.markdown(f"""
+                        <div class="translation-box">
+                            <div class="language-header">{target_lang_name}</div>
+                            <div style="font-size: 1.05rem; line-height: 1.6;">
+                                {translation}
+                            </div>
                         </div>
-                    </div>
-                """, unsafe_allow_html=True)
-
-            # Create downloadable text file
-            download_content = f"MULTI-LANGUAGE BROADCAST\n{'='*50}\n\n"
-            download_content += f"ORIGINAL (English):\n{broadcast_text}\n\n"
-            download_content += f"{'='*50}\n\nTRANSLATIONS:\n\n"
-
-            for lang_name, translation in translations.items():
-                download_content += f"{lang_name.upper()}:\n{translation}\n\n{'-'*50}\n\n"
-
-            st.download_button(
-                label="📥 Download All Translations",
-                data=download_content,
-                file_name="community_broadcast_translations.txt",
-                mime="text/plain",
-                key="download_broadcast"
+                    """, unsafe_allow_html=True)
+            finally:
+                exporter.close()
+
+            if exporter.completed == len(selected_languages):
+                status_text.text("✅ All translations completed!")
+                st.balloons()
+            else:
+                status_text.text(f"Completed {exporter.completed} of {len(selected_languages)} translations.")
+
+    # Exports live on disk, so they stay downloadable across reruns
+    broadcast_export = st.session_state.get("broadcast_export")
+    if broadcast_export and os.path.isdir(broadcast_export["dir"]):
+        if broadcast_export["completed"] < broadcast_export["total"]:
+            st.markdown(
+                f"### 📥 Download Partial Translations "
+                f"({broadcast_export['completed']} of {broadcast_export['total']})"
             )
+        else:
+            st.markdown("### 📥 Download All Translations")
+        if not render_export_downloads(broadcast_export["dir"], "download_broadcast"):
+            st.session_state.pop("broadcast_export", None)
+            st.info("This export has expired. Run the broadcast again to download it.")
 
 # TAB 3: Document Templates
 with tab3:
@@ -493,7 +1174,7 @@ with tab3:
                     source_code = LANGUAGES[template_source_lang]
                     target_code = LANGUAGES[template_target_lang]
 
-                    translation = translate_text(template_text, source_code, target_code, tokenizer, model)
+                    translation = request_translation(template_text, source_code, target_code, tokenizer, model, use_glossary)
 
                     st.markdown("### ✅ Translated Template")
                     st.markdown(f"""
@@ -516,6 +1197,8 @@ with tab3:
                         key="download_template"
                     )
 
+                except (TranslationBusyError, RateLimitExceededError) as e:
+                    st.warning(f"⚠️ {str(e)}")
                 except Exception as e:
                     st.error(f"Translation error: {str(e)}")
                     st.info("Please check your internet connection for model download on first run.")